@@ -66,12 +66,11 @@ async def async_setup_entry(
     device_list: list[MIoTDevice] = hass.data[DOMAIN]['devices'][
         config_entry.entry_id]
 
-    new_entities = []
-    for miot_device in device_list:
-        if miot_device.miot_client.display_binary_bool:
-            for prop in miot_device.prop_list.get('binary_sensor', []):
-                new_entities.append(BinarySensor(
-                    miot_device=miot_device, spec=prop))
+    new_entities = [
+        BinarySensor(miot_device=miot_device, spec=prop)
+        for miot_device in device_list
+        if miot_device.miot_client.display_binary_bool
+        for prop in miot_device.prop_list.get('binary_sensor', [])]
 
     if new_entities:
         async_add_entities(new_entities)
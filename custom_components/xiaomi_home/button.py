@@ -66,10 +66,10 @@ async def async_setup_entry(
     device_list: list[MIoTDevice] = hass.data[DOMAIN]['devices'][
         config_entry.entry_id]
 
-    new_entities = []
-    for miot_device in device_list:
-        for action in miot_device.action_list.get('button', []):
-            new_entities.append(Button(miot_device=miot_device, spec=action))
+    new_entities = [
+        Button(miot_device=miot_device, spec=action)
+        for miot_device in device_list
+        for action in miot_device.action_list.get('button', [])]
 
     if new_entities:
         async_add_entities(new_entities)
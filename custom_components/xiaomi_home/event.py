@@ -67,10 +67,10 @@ async def async_setup_entry(
     device_list: list[MIoTDevice] = hass.data[DOMAIN]['devices'][
         config_entry.entry_id]
 
-    new_entities = []
-    for miot_device in device_list:
-        for event in miot_device.event_list.get('event', []):
-            new_entities.append(Event(miot_device=miot_device, spec=event))
+    new_entities = [
+        Event(miot_device=miot_device, spec=event)
+        for miot_device in device_list
+        for event in miot_device.event_list.get('event', [])]
 
     if new_entities:
         async_add_entities(new_entities)
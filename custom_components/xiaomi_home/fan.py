@@ -80,10 +80,10 @@ async def async_setup_entry(
     """Set up a config entry."""
     device_list: list[MIoTDevice] = hass.data[DOMAIN]['devices'][
         config_entry.entry_id]
-    new_entities = []
-    for miot_device in device_list:
-        for data in miot_device.entity_list.get('fan', []):
-            new_entities.append(Fan(miot_device=miot_device, entity_data=data))
+    new_entities = [
+        Fan(miot_device=miot_device, entity_data=data)
+        for miot_device in device_list
+        for data in miot_device.entity_list.get('fan', [])]
 
     if new_entities:
         async_add_entities(new_entities)
@@ -46,8 +46,9 @@ off Xiaomi or its affiliates' products.
 Light entities for Xiaomi Home.
 """
 from __future__ import annotations
+import asyncio
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -82,11 +83,10 @@ async def async_setup_entry(
     device_list: list[MIoTDevice] = hass.data[DOMAIN]['devices'][
         config_entry.entry_id]
 
-    new_entities = []
-    for miot_device in device_list:
-        for data in miot_device.entity_list.get('light', []):
-            new_entities.append(
-                Light(miot_device=miot_device, entity_data=data))
+    new_entities = [
+        Light(miot_device=miot_device, entity_data=data)
+        for miot_device in device_list
+        for data in miot_device.entity_list.get('light', [])]
 
     if new_entities:
         async_add_entities(new_entities)
@@ -101,9 +101,13 @@ class Light(MIoTServiceEntity, LightEntity):
     _prop_color_temp: Optional[MIoTSpecProperty]
     _prop_color: Optional[MIoTSpecProperty]
     _prop_mode: Optional[MIoTSpecProperty]
+    _value_on: Any
+    _value_off: Any
 
     _brightness_scale: Optional[tuple[int, int]]
     _mode_map: Optional[dict[Any, Any]]
+    _mode_key_map: Optional[dict[Any, Any]]
+    _effect_list: Optional[list[str]]
 
     def __init__(
         self, miot_device: MIoTDevice,  entity_data: MIoTEntityData
@@ -121,81 +125,20 @@ class Light(MIoTServiceEntity, LightEntity):
         self._prop_color_temp = None
         self._prop_color = None
         self._prop_mode = None
+        self._value_on = None
+        self._value_off = None
         self._brightness_scale = None
         self._mode_map = None
+        self._mode_key_map = None
+        self._effect_list = None
 
         # properties
         for prop in entity_data.props:
-            # on
-            if prop.name == 'on':
-                self._prop_on = prop
-            # brightness
-            if prop.name == 'brightness':
-                if prop.value_range:
-                    self._brightness_scale = (
-                        prop.value_range.min_, prop.value_range.max_)
-                    self._prop_brightness = prop
-                elif (
-                    self._mode_map is None
-                    and prop.value_list
-                ):
-                    # For value-list brightness
-                    self._mode_map = prop.value_list.to_map()
-                    self._attr_effect_list = list(self._mode_map.values())
-                    self._attr_supported_features |= LightEntityFeature.EFFECT
-                    self._prop_mode = prop
-                else:
-                    _LOGGER.info(
-                        'invalid brightness format, %s', self.entity_id)
-                    continue
-            # color-temperature
-            if prop.name == 'color-temperature':
-                if not prop.value_range:
-                    _LOGGER.info(
-                        'invalid color-temperature value_range format, %s',
-                        self.entity_id)
-                    continue
-                self._attr_min_color_temp_kelvin = prop.value_range.min_
-                self._attr_max_color_temp_kelvin = prop.value_range.max_
-                self._attr_supported_color_modes.add(ColorMode.COLOR_TEMP)
-                self._attr_color_mode = ColorMode.COLOR_TEMP
-                self._prop_color_temp = prop
-            # color
-            if prop.name == 'color':
-                self._attr_supported_color_modes.add(ColorMode.RGB)
-                self._attr_color_mode = ColorMode.RGB
-                self._prop_color = prop
-            # mode
-            if prop.name == 'mode':
-                mode_list = None
-                if prop.value_list:
-                    mode_list = prop.value_list.to_map()
-                elif prop.value_range:
-                    mode_list = {}
-                    if (
-                        int((
-                            prop.value_range.max_
-                            - prop.value_range.min_
-                        ) / prop.value_range.step)
-                        > self._VALUE_RANGE_MODE_COUNT_MAX
-                    ):
-                        _LOGGER.info(
-                            'too many mode values, %s, %s, %s',
-                            self.entity_id, prop.name, prop.value_range)
-                    else:
-                        for value in range(
-                                prop.value_range.min_,
-                                prop.value_range.max_,
-                                prop.value_range.step):
-                            mode_list[value] = f'mode {value}'
-                if mode_list:
-                    self._mode_map = mode_list
-                    self._attr_effect_list = list(self._mode_map.values())
-                    self._attr_supported_features |= LightEntityFeature.EFFECT
-                    self._prop_mode = prop
-                else:
-                    _LOGGER.info('invalid mode format, %s', self.entity_id)
-                    continue
+            handler = _PROP_HANDLERS.get(prop.name)
+            if handler:
+                handler(self, prop)
+        if self._mode_map:
+            self._mode_key_map = {v: k for k, v in self._mode_map.items()}
 
         if not self._attr_supported_color_modes:
             if self._prop_brightness:
@@ -205,10 +148,79 @@ class Light(MIoTServiceEntity, LightEntity):
                 self._attr_supported_color_modes.add(ColorMode.ONOFF)
                 self._attr_color_mode = ColorMode.ONOFF
 
+    def _init_prop_on(self, prop: MIoTSpecProperty) -> None:
+        self._prop_on = prop
+        # Dirty logic for lumi.gateway.mgl03 indicator light
+        self._value_on = True if prop.format_ == bool else 1
+        self._value_off = False if prop.format_ == bool else 0
+
+    def _init_prop_brightness(self, prop: MIoTSpecProperty) -> None:
+        if prop.value_range:
+            self._brightness_scale = (
+                prop.value_range.min_, prop.value_range.max_)
+            self._prop_brightness = prop
+        elif (
+            self._mode_map is None
+            and prop.value_list
+        ):
+            # For value-list brightness
+            self._mode_map = prop.value_list.to_map()
+            self._attr_supported_features |= LightEntityFeature.EFFECT
+            self._prop_mode = prop
+        else:
+            _LOGGER.info(
+                'invalid brightness format, %s', self.entity_id)
+
+    def _init_prop_color_temp(self, prop: MIoTSpecProperty) -> None:
+        if not prop.value_range:
+            _LOGGER.info(
+                'invalid color-temperature value_range format, %s',
+                self.entity_id)
+            return
+        self._attr_min_color_temp_kelvin = prop.value_range.min_
+        self._attr_max_color_temp_kelvin = prop.value_range.max_
+        self._attr_supported_color_modes.add(ColorMode.COLOR_TEMP)
+        self._attr_color_mode = ColorMode.COLOR_TEMP
+        self._prop_color_temp = prop
+
+    def _init_prop_color(self, prop: MIoTSpecProperty) -> None:
+        self._attr_supported_color_modes.add(ColorMode.RGB)
+        self._attr_color_mode = ColorMode.RGB
+        self._prop_color = prop
+
+    def _init_prop_mode(self, prop: MIoTSpecProperty) -> None:
+        mode_list = None
+        if prop.value_list:
+            mode_list = prop.value_list.to_map()
+        elif prop.value_range:
+            mode_list = {}
+            if (
+                int((
+                    prop.value_range.max_
+                    - prop.value_range.min_
+                ) / prop.value_range.step)
+                > self._VALUE_RANGE_MODE_COUNT_MAX
+            ):
+                _LOGGER.info(
+                    'too many mode values, %s, %s, %s',
+                    self.entity_id, prop.name, prop.value_range)
+            else:
+                mode_range = range(
+                    prop.value_range.min_,
+                    prop.value_range.max_,
+                    prop.value_range.step)
+                mode_list = {value: f'mode {value}' for value in mode_range}
+        if mode_list:
+            self._mode_map = mode_list
+            self._attr_supported_features |= LightEntityFeature.EFFECT
+            self._prop_mode = prop
+        else:
+            _LOGGER.info('invalid mode format, %s', self.entity_id)
+
     @property
     def is_on(self) -> Optional[bool]:
         """Return if the light is on."""
-        value_on = self.get_prop_value(prop=self._prop_on)
+        value_on = self._prop_value_map.get(self._prop_on)
         # Dirty logic for lumi.gateway.mgl03 indicator light
         if isinstance(value_on, int):
             value_on = value_on == 1
@@ -217,7 +229,7 @@ class Light(MIoTServiceEntity, LightEntity):
     @property
     def brightness(self) -> Optional[int]:
         """Return the brightness."""
-        brightness_value = self.get_prop_value(prop=self._prop_brightness)
+        brightness_value = self._prop_value_map.get(self._prop_brightness)
         if brightness_value is None:
             return None
         return value_to_brightness(self._brightness_scale, brightness_value)
@@ -225,74 +237,97 @@ class Light(MIoTServiceEntity, LightEntity):
     @property
     def color_temp_kelvin(self) -> Optional[int]:
         """Return the color temperature."""
-        return self.get_prop_value(prop=self._prop_color_temp)
+        return self._prop_value_map.get(self._prop_color_temp)
 
     @property
     def rgb_color(self) -> Optional[tuple[int, int, int]]:
         """Return the rgb color value."""
-        rgb = self.get_prop_value(prop=self._prop_color)
+        rgb = self._prop_value_map.get(self._prop_color)
         if rgb is None:
             return None
-        r = (rgb >> 16) & 0xFF
-        g = (rgb >> 8) & 0xFF
-        b = rgb & 0xFF
-        return r, g, b
+        return tuple((rgb & 0xFFFFFF).to_bytes(3, 'big'))
+
+    @property
+    def effect_list(self) -> Optional[list[str]]:
+        """Return the list of supported effects."""
+        if self._effect_list is None and self._mode_map:
+            self._effect_list = list(self._mode_map.values())
+        return self._effect_list
 
     @property
     def effect(self) -> Optional[str]:
         """Return the current mode."""
         return self.get_map_value(
             map_=self._mode_map,
-            key=self.get_prop_value(prop=self._prop_mode))
+            key=self._prop_value_map.get(self._prop_mode))
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the light on.
 
         Shall set attributes in kwargs if applicable.
         """
+        # Compute all values first, then set the independent properties
+        # concurrently
+        set_values: dict[str, tuple[Optional[MIoTSpecProperty], Any]] = {}
         # on
-        # Dirty logic for lumi.gateway.mgl03 indicator light
         if self._prop_on:
-            value_on = True if self._prop_on.format_ == bool else 1
-            await self.set_property_async(
-                prop=self._prop_on, value=value_on)
+            set_values['on'] = (self._prop_on, self._value_on)
         # brightness
         if ATTR_BRIGHTNESS in kwargs:
-            brightness = brightness_to_value(
-                self._brightness_scale, kwargs[ATTR_BRIGHTNESS])
-            await self.set_property_async(
-                prop=self._prop_brightness, value=brightness,
-                write_ha_state=False)
+            set_values[ATTR_BRIGHTNESS] = (
+                self._prop_brightness,
+                brightness_to_value(
+                    self._brightness_scale, kwargs[ATTR_BRIGHTNESS]))
         # color-temperature
         if ATTR_COLOR_TEMP_KELVIN in kwargs:
-            await self.set_property_async(
-                prop=self._prop_color_temp,
-                value=kwargs[ATTR_COLOR_TEMP_KELVIN],
-                write_ha_state=False)
-            self._attr_color_mode = ColorMode.COLOR_TEMP
+            set_values[ATTR_COLOR_TEMP_KELVIN] = (
+                self._prop_color_temp, kwargs[ATTR_COLOR_TEMP_KELVIN])
         # rgb color
         if ATTR_RGB_COLOR in kwargs:
-            r = kwargs[ATTR_RGB_COLOR][0]
-            g = kwargs[ATTR_RGB_COLOR][1]
-            b = kwargs[ATTR_RGB_COLOR][2]
-            rgb = (r << 16) | (g << 8) | b
-            await self.set_property_async(
-                prop=self._prop_color, value=rgb,
-                write_ha_state=False)
-            self._attr_color_mode = ColorMode.RGB
+            set_values[ATTR_RGB_COLOR] = (
+                self._prop_color,
+                int.from_bytes(bytes(kwargs[ATTR_RGB_COLOR]), 'big'))
         # mode
         if ATTR_EFFECT in kwargs:
-            await self.set_property_async(
-                prop=self._prop_mode,
-                value=self.get_map_key(
-                    map_=self._mode_map, value=kwargs[ATTR_EFFECT]),
-                write_ha_state=False)
+            set_values[ATTR_EFFECT] = (
+                self._prop_mode,
+                self._mode_key_map.get(kwargs[ATTR_EFFECT])
+                if self._mode_key_map else None)
+        results = dict(zip(set_values, await asyncio.gather(
+            *(
+                self.set_property_async(
+                    prop=prop, value=value, write_ha_state=False)
+                for prop, value in set_values.values()),
+            return_exceptions=True)))
+        # Optimistic state, set_property_async already stored the values of
+        # succeeded writes, no need to read them back
+        if results.get(ATTR_COLOR_TEMP_KELVIN) is True:
+            self._attr_color_mode = ColorMode.COLOR_TEMP
+        if results.get(ATTR_RGB_COLOR) is True:
+            self._attr_color_mode = ColorMode.RGB
         self.async_write_ha_state()
+        errors: list[BaseException] = []
+        for key, result in results.items():
+            if isinstance(result, BaseException):
+                _LOGGER.error(
+                    'set %s failed, %s, %s', key, self.entity_id, result)
+                errors.append(result)
+        if errors:
+            raise errors[0]
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the light off."""
         if not self._prop_on:
             return
-        # Dirty logic for lumi.gateway.mgl03 indicator light
-        value_on = False if self._prop_on.format_ == bool else 0
-        await self.set_property_async(prop=self._prop_on, value=value_on)
+        await self.set_property_async(
+            prop=self._prop_on, value=self._value_off)
+
+
+# pylint: disable=protected-access
+_PROP_HANDLERS: dict[str, Callable[[Light, MIoTSpecProperty], None]] = {
+    'on': Light._init_prop_on,
+    'brightness': Light._init_prop_brightness,
+    'color-temperature': Light._init_prop_color_temp,
+    'color': Light._init_prop_color,
+    'mode': Light._init_prop_mode,
+}
@@ -1097,6 +1097,7 @@ class MIoTServiceEntity(Entity):
 
     def __on_properties_changed(self, params: dict, ctx: Any) -> None:
         _LOGGER.debug('properties changed, %s', params)
+        changed: bool = False
         for prop in self.entity_data.props:
             if (
                 prop.iid != params['piid']
@@ -1104,11 +1105,17 @@ class MIoTServiceEntity(Entity):
             ):
                 continue
             value: Any = prop.value_format(params['value'])
+            changed = (
+                prop not in self._prop_value_map
+                or self._prop_value_map[prop] != value)
             self._prop_value_map[prop] = value
             if prop in self._prop_changed_subs:
+                # The handler may update other properties, always write
+                changed = True
                 self._prop_changed_subs[prop](prop, value)
             break
-        if not self._pending_write_ha_state_timer:
+        # Skip identical state write
+        if changed and not self._pending_write_ha_state_timer:
             self.async_write_ha_state()
 
     def __on_event_occurred(self, params: dict, ctx: Any) -> None:
@@ -72,10 +72,10 @@ async def async_setup_entry(
     device_list: list[MIoTDevice] = hass.data[DOMAIN]['devices'][
         config_entry.entry_id]
 
-    new_entities = []
-    for miot_device in device_list:
-        for action in miot_device.action_list.get('notify', []):
-            new_entities.append(Notify(miot_device=miot_device, spec=action))
+    new_entities = [
+        Notify(miot_device=miot_device, spec=action)
+        for miot_device in device_list
+        for action in miot_device.action_list.get('notify', [])]
 
     if new_entities:
         async_add_entities(new_entities)
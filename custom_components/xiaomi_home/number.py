@@ -67,10 +67,10 @@ async def async_setup_entry(
     device_list: list[MIoTDevice] = hass.data[DOMAIN]['devices'][
         config_entry.entry_id]
 
-    new_entities = []
-    for miot_device in device_list:
-        for prop in miot_device.prop_list.get('number', []):
-            new_entities.append(Number(miot_device=miot_device, spec=prop))
+    new_entities = [
+        Number(miot_device=miot_device, spec=prop)
+        for miot_device in device_list
+        for prop in miot_device.prop_list.get('number', [])]
 
     if new_entities:
         async_add_entities(new_entities)
@@ -68,10 +68,10 @@ async def async_setup_entry(
     device_list: list[MIoTDevice] = hass.data[DOMAIN]['devices'][
         config_entry.entry_id]
 
-    new_entities = []
-    for miot_device in device_list:
-        for prop in miot_device.prop_list.get('switch', []):
-            new_entities.append(Switch(miot_device=miot_device, spec=prop))
+    new_entities = [
+        Switch(miot_device=miot_device, spec=prop)
+        for miot_device in device_list
+        for prop in miot_device.prop_list.get('switch', [])]
 
     if new_entities:
         async_add_entities(new_entities)
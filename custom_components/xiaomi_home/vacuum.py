@@ -73,11 +73,11 @@ async def async_setup_entry(
 ) -> None:
     device_list: list[MIoTDevice] = hass.data[DOMAIN]['devices'][
         config_entry.entry_id]
-    new_entities = []
-    for miot_device in device_list:
-        for data in miot_device.entity_list.get('vacuum', []):
-            new_entities.append(
-                Vacuum(miot_device=miot_device, entity_data=data))
+    new_entities = [
+        Vacuum(miot_device=miot_device, entity_data=data)
+        for miot_device in device_list
+        for data in miot_device.entity_list.get('vacuum', [])]
+
     if new_entities:
         async_add_entities(new_entities)
 
@@ -76,11 +76,10 @@ async def async_setup_entry(
     device_list: list[MIoTDevice] = hass.data[DOMAIN]['devices'][
         config_entry.entry_id]
 
-    new_entities = []
-    for miot_device in device_list:
-        for data in miot_device.entity_list.get('water_heater', []):
-            new_entities.append(WaterHeater(
-                miot_device=miot_device, entity_data=data))
+    new_entities = [
+        WaterHeater(miot_device=miot_device, entity_data=data)
+        for miot_device in device_list
+        for data in miot_device.entity_list.get('water_heater', [])]
 
     if new_entities:
         async_add_entities(new_entities)
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 """Test rule format."""
+from collections import deque
 import json
 import logging
 from os import listdir, path
-from typing import Optional
+from typing import Any, Optional
 import pytest
 import yaml
 
@@ -61,44 +62,37 @@ def save_yaml_file(file_path: str, data: dict) -> None:
             allow_unicode=True, indent=2, sort_keys=False)
 
 
+# JSON/YAML loaders never produce subclasses, compare types by identity
+# pylint: disable=unidiomatic-typecheck
 def dict_str_str(d: dict) -> bool:
     """restricted format: dict[str, str]"""
-    if not isinstance(d, dict):
+    if type(d) is not dict:
         return False
     for k, v in d.items():
-        if not isinstance(k, str) or not isinstance(v, str):
+        if type(k) is not str or type(v) is not str:
             return False
     return True
 
 
 def dict_str_dict(d: dict) -> bool:
     """restricted format: dict[str, dict]"""
-    if not isinstance(d, dict):
+    if type(d) is not dict:
         return False
     for k, v in d.items():
-        if not isinstance(k, str) or not isinstance(v, dict):
-            return False
-    return True
-
-
-def nested_2_dict_str_str(d: dict) -> bool:
-    """restricted format: dict[str, dict[str, str]]"""
-    if not dict_str_dict(d):
-        return False
-    for v in d.values():
-        if not dict_str_str(v):
+        if type(k) is not str or type(v) is not dict:
             return False
     return True
 
 
 def nested_3_dict_str_str(d: dict) -> bool:
     """restricted format: dict[str, dict[str, dict[str, str]]]"""
-    if not dict_str_dict(d):
-        return False
-    for v in d.values():
-        if not nested_2_dict_str_str(v):
-            return False
-    return True
+    return type(d) is dict and all(
+        type(k) is str and type(v) is dict and all(
+            type(k2) is str and type(v2) is dict and all(
+                type(k3) is str and type(v3) is str
+                for k3, v3 in v2.items())
+            for k2, v2 in v.items())
+        for k, v in d.items())
 
 
 def spec_filter(d: dict) -> bool:
@@ -107,9 +101,9 @@ def spec_filter(d: dict) -> bool:
         return False
     for value in d.values():
         for k, v in value.items():
-            if not isinstance(k, str) or not isinstance(v, list):
+            if type(k) is not str or type(v) is not list:
                 return False
-            if not all(isinstance(i, str) for i in v):
+            if not all(type(i) is str for i in v):
                 return False
     return True
 
@@ -130,11 +124,10 @@ def bool_trans(d: dict) -> bool:
         return False
     default_keys: set[str] = set(default_trans.keys())
     for key, trans in d['translate'].items():
-        trans_keys: set[str] = set(trans.keys())
-        if set(trans.keys()) != default_keys:
+        if trans.keys() != default_keys:
             _LOGGER.info(
                 'bool trans inconsistent, %s, %s, %s',
-                key, default_keys, trans_keys)
+                key, default_keys, set(trans.keys()))
             return False
     return True
 
@@ -155,55 +148,53 @@ def spec_modify(data: dict) -> bool:
 
 
 def compare_dict_structure(dict1: dict, dict2: dict) -> bool:
-    if not isinstance(dict1, dict) or not isinstance(dict2, dict):
-        _LOGGER.info('invalid type')
-        return False
-    if dict1.keys() != dict2.keys():
-        _LOGGER.info(
-            'inconsistent key values, %s, %s', dict1.keys(), dict2.keys())
-        return False
-    for key in dict1:
-        if isinstance(dict1[key], dict) and isinstance(dict2[key], dict):
-            if not compare_dict_structure(dict1[key], dict2[key]):
-                _LOGGER.info(
-                    'inconsistent key values, dict, %s', key)
-                return False
-        elif isinstance(dict1[key], list) and isinstance(dict2[key], list):
-            if not all(
-                    isinstance(i, type(j))
-                    for i, j in zip(dict1[key], dict2[key])):
-                _LOGGER.info(
-                    'inconsistent key values, list, %s', key)
-                return False
-        elif not isinstance(dict1[key], type(dict2[key])):
+    queue: deque[tuple[str, Any, Any]] = deque([('', dict1, dict2)])
+    while queue:
+        key_path, d1, d2 = queue.popleft()
+        if not isinstance(d1, dict) or not isinstance(d2, dict):
+            _LOGGER.info('invalid type, %s', key_path)
+            return False
+        if d1.keys() ^ d2.keys():
             _LOGGER.info(
-                'inconsistent key values, type, %s', key)
+                'inconsistent key values, dict, %s, %s, %s',
+                key_path, d1.keys(), d2.keys())
             return False
+        for key, v1 in d1.items():
+            v2 = d2[key]
+            sub_path = f'{key_path}.{key}' if key_path else key
+            if isinstance(v1, dict) and isinstance(v2, dict):
+                queue.append((sub_path, v1, v2))
+            elif isinstance(v1, list) and isinstance(v2, list):
+                if not all(isinstance(i, type(j)) for i, j in zip(v1, v2)):
+                    _LOGGER.info(
+                        'inconsistent key values, list, %s', sub_path)
+                    return False
+            elif not isinstance(v1, type(v2)):
+                _LOGGER.info(
+                    'inconsistent key values, type, %s', sub_path)
+                return False
     return True
 
 
-def sort_bool_trans(file_path: str):
-    trans_data = load_yaml_file(file_path=file_path)
-    assert isinstance(trans_data, dict), f'{file_path} format error'
-    trans_data['data'] = dict(sorted(trans_data['data'].items()))
+def sort_bool_trans(data: dict) -> dict:
+    trans_data = dict(data)
+    trans_data['translate'] = dict(data['translate'])
+    trans_data['data'] = {
+        k: trans_data['data'][k] for k in sorted(trans_data['data'])}
     for key, trans in trans_data['translate'].items():
-        trans_data['translate'][key] = dict(sorted(trans.items()))
+        trans_data['translate'][key] = {k: trans[k] for k in sorted(trans)}
     return trans_data
 
 
-def sort_spec_filter(file_path: str):
-    filter_data = load_yaml_file(file_path=file_path)
-    assert isinstance(filter_data, dict), f'{file_path} format error'
-    filter_data = dict(sorted(filter_data.items()))
+def sort_spec_filter(data: dict) -> dict:
+    filter_data = {k: data[k] for k in sorted(data)}
     for urn, spec in filter_data.items():
-        filter_data[urn] = dict(sorted(spec.items()))
+        filter_data[urn] = {k: spec[k] for k in sorted(spec)}
     return filter_data
 
 
-def sort_spec_modify(file_path: str):
-    filter_data = load_yaml_file(file_path=file_path)
-    assert isinstance(filter_data, dict), f'{file_path} format error'
-    return dict(sorted(filter_data.items()))
+def sort_spec_modify(data: dict) -> dict:
+    return {k: data[k] for k in sorted(data)}
 
 
 @pytest.mark.github
@@ -297,28 +288,32 @@ def test_miot_data_sort():
     assert list(INTEGRATION_LANGUAGES.keys()) == list(sort_langs.keys()), (
         'INTEGRATION_LANGUAGES not sorted, correct order\r\n'
         f'{list(sort_langs.keys())}')
-    assert json.dumps(
-        load_yaml_file(file_path=SPEC_BOOL_TRANS_FILE)) == json.dumps(
-            sort_bool_trans(file_path=SPEC_BOOL_TRANS_FILE)), (
-                f'{SPEC_BOOL_TRANS_FILE} not sorted, goto project root path'
-                ' and run the following command sorting, ',
-                'pytest -s -v -m update ./test/check_rule_format.py')
-    assert json.dumps(
-        load_yaml_file(file_path=SPEC_FILTER_FILE)) == json.dumps(
-            sort_spec_filter(file_path=SPEC_FILTER_FILE)), (
-                f'{SPEC_FILTER_FILE} not sorted, goto project root path'
-                ' and run the following command sorting, ',
-                'pytest -s -v -m update ./test/check_rule_format.py')
+    bool_trans_data = load_yaml_file(file_path=SPEC_BOOL_TRANS_FILE)
+    assert isinstance(bool_trans_data, dict), (
+        f'{SPEC_BOOL_TRANS_FILE} format error')
+    assert json.dumps(bool_trans_data) == json.dumps(
+        sort_bool_trans(data=bool_trans_data)), (
+            f'{SPEC_BOOL_TRANS_FILE} not sorted, goto project root path'
+            ' and run the following command sorting, ',
+            'pytest -s -v -m update ./test/check_rule_format.py')
+    filter_data = load_yaml_file(file_path=SPEC_FILTER_FILE)
+    assert isinstance(filter_data, dict), f'{SPEC_FILTER_FILE} format error'
+    # Every level of spec_filter is key-sorted, let json sort it in one pass
+    assert json.dumps(filter_data) == json.dumps(
+        filter_data, sort_keys=True), (
+            f'{SPEC_FILTER_FILE} not sorted, goto project root path'
+            ' and run the following command sorting, ',
+            'pytest -s -v -m update ./test/check_rule_format.py')
 
 
 @pytest.mark.update
 def test_sort_spec_data():
-    sort_data: dict = sort_bool_trans(file_path=SPEC_BOOL_TRANS_FILE)
-    save_yaml_file(file_path=SPEC_BOOL_TRANS_FILE, data=sort_data)
-    _LOGGER.info('%s formatted.', SPEC_BOOL_TRANS_FILE)
-    sort_data = sort_spec_filter(file_path=SPEC_FILTER_FILE)
-    save_yaml_file(file_path=SPEC_FILTER_FILE, data=sort_data)
-    _LOGGER.info('%s formatted.', SPEC_FILTER_FILE)
-    sort_data = sort_spec_modify(file_path=SPEC_MODIFY_FILE)
-    save_yaml_file(file_path=SPEC_MODIFY_FILE, data=sort_data)
-    _LOGGER.info('%s formatted.', SPEC_MODIFY_FILE)
+    for file_path, sort_func in (
+        (SPEC_BOOL_TRANS_FILE, sort_bool_trans),
+        (SPEC_FILTER_FILE, sort_spec_filter),
+        (SPEC_MODIFY_FILE, sort_spec_modify)
+    ):
+        data = load_yaml_file(file_path=file_path)
+        assert isinstance(data, dict), f'{file_path} format error'
+        save_yaml_file(file_path=file_path, data=sort_func(data=data))
+        _LOGGER.info('%s formatted.', file_path)
@@ -3,8 +3,9 @@
 import logging
 import random
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 import pytest
-from os import path, makedirs
+from os import link, path, makedirs, remove
 from uuid import uuid4
 
 TEST_ROOT_PATH: str = path.dirname(path.abspath(__file__))
@@ -20,6 +21,17 @@ DOMAIN_CLOUD_CACHE: str = 'cloud_cache'
 _LOGGER = logging.getLogger(__name__)
 
 
+def _link_or_copy(src: str, dst: str) -> None:
+    # Test files are read-only, hardlink them and fall back to copy if the
+    # file system does not support it
+    try:
+        if path.exists(dst):
+            remove(dst)
+        link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
 @pytest.fixture(scope='session', autouse=True)
 def set_logger():
     logger = logging.getLogger()
@@ -50,34 +62,28 @@ def load_py_file():
         'miot_storage.py']
     makedirs(TEST_CACHE_PATH, exist_ok=True)
     makedirs(TEST_FILES_PATH, exist_ok=True)
-    for file_name in file_list:
-        shutil.copyfile(
-            path.join(
-                TEST_ROOT_PATH, '../custom_components/xiaomi_home/miot',
-                file_name),
-            path.join(TEST_FILES_PATH, file_name))
-    _LOGGER.info('\nloaded test py files, %s', file_list)
-    # Copy spec files to test folder
-    shutil.copytree(
-        src=path.join(
-            TEST_ROOT_PATH, '../custom_components/xiaomi_home/miot/specs'),
-        dst=path.join(TEST_FILES_PATH, 'specs'),
-        dirs_exist_ok=True)
-    _LOGGER.info('loaded spec test folder, specs')
-    # Copy lan files to test folder
-    shutil.copytree(
-        src=path.join(
-            TEST_ROOT_PATH, '../custom_components/xiaomi_home/miot/lan'),
-        dst=path.join(TEST_FILES_PATH, 'lan'),
-        dirs_exist_ok=True)
-    _LOGGER.info('loaded lan test folder, lan')
-    # Copy i18n files to test folder
-    shutil.copytree(
-        src=path.join(
-            TEST_ROOT_PATH, '../custom_components/xiaomi_home/miot/i18n'),
-        dst=path.join(TEST_FILES_PATH, 'i18n'),
-        dirs_exist_ok=True)
-    _LOGGER.info('loaded i18n test folder, i18n')
+    miot_path: str = path.join(
+        TEST_ROOT_PATH, '../custom_components/xiaomi_home/miot')
+    folder_list = ['specs', 'lan', 'i18n']
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # Copy spec, lan and i18n folders to test folder
+        folder_futures = [
+            executor.submit(
+                shutil.copytree,
+                src=path.join(miot_path, folder_name),
+                dst=path.join(TEST_FILES_PATH, folder_name),
+                copy_function=_link_or_copy,
+                dirs_exist_ok=True)
+            for folder_name in folder_list]
+        list(executor.map(
+            lambda file_name: _link_or_copy(
+                path.join(miot_path, file_name),
+                path.join(TEST_FILES_PATH, file_name)),
+            file_list))
+        _LOGGER.info('\nloaded test py files, %s', file_list)
+        for future in folder_futures:
+            future.result()
+        _LOGGER.info('loaded test folders, %s', folder_list)
 
     yield
 